@@ -1,3 +1,4 @@
+import io
 import os
 import sys
 import subprocess
@@ -6,9 +7,12 @@ import time
 import random
 import signal
 import select
+import shutil
 import tty
 import termios
 import socket
+from functools import lru_cache
+from itertools import count, zip_longest
 from pathlib import Path
 
 # --- Configuration ---
@@ -18,18 +22,69 @@ DISLIKES_FILE = MUSIC_ROOT / "dislikes.txt"
 MPV_SOCKET = Path("/tmp/mpv-musicplayer")
 SUPPORTED_EXTENSIONS = ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a']
 
+# Parts of the interface that need rebuilding on the next draw
+DIRTY_HEADER = 1  # Now-playing line
+DIRTY_INFO = 2    # Size/sample rate/bitrate row
+DIRTY_LIST = 4    # Song list (and everything around it)
+DIRTY_ALL = DIRTY_HEADER | DIRTY_INFO | DIRTY_LIST
+LIST_TOP = 5      # Frame index of the first song line
+CHROME_ROWS = 12  # Rows used by everything but the song list, including progress and feedback
+
+# Static interface lines, encoded once
+HEADER_BORDER = "\033[1;35m╔═══════════════════ NOW PLAYING ═══════════════════╗\033[0m".encode()
+SEPARATOR = "\033[1;35m╠═══════════════════════════════════════════════════╣\033[0m".encode()
+CONTROLS_BLOCK = tuple(line.encode() for line in (
+    "\033[1;35m╠═══════════════════════ CONTROLS ══════════════════════╣\033[0m",
+    "  [\033[1;33ml\033[0m] like    [\033[1;31md\033[0m] dislike    [\033[1mn\033[0m] next",
+    "  [\033[1mb\033[0m] skip −5s    [\033[1mf\033[0m] skip +5s    [\033[1mp/SPACE\033[0m] play/pause",
+    "  [\033[1ms\033[0m] choose song    [\033[1mc\033[0m] change folder    [\033[1mq\033[0m] quit",
+    "\033[1;35m╚═══════════════════════════════════════════════════╝\033[0m",
+))
+CLEAR = b"\033[H\033[2J"
+LOADING = "\033[1;33mLoading...\033[0m".encode()
+_SAVE = b"\033[s"     # Save cursor position
+_RESTORE = b"\033[u"  # Restore cursor position
+_EOL = b"\033[K"      # Clear to end of line
+# Long lines must not wrap onto the next row: the shadow diff assumes one row per frame line
+_NOWRAP = b"\033[?7l"  # Autowrap off
+_WRAP = b"\033[?7h"    # Autowrap on
+# Progress bars for 0-100%, 50 cells wide
+_BARS = [
+    f"[\033[1;36m{'█' * (50 * p // 100)}{'░' * (50 - 50 * p // 100)}\033[0m] {p}%".encode()
+    for p in range(101)
+]
+
 # --- Globals ---
 mpv_process = None
 current_folder = ""
 songs = []
+song_names = []  # File names of songs, in the same order
 current_song_index = 0
-needs_full_redraw = True
+prev_song_index = None  # Song marked with ▶ in the current frame
+list_start = 0  # Index of the first song shown in the list
+list_rows = 0   # Number of song lines that fit on screen
+dirty = DIRTY_ALL
 old_termios_settings = None
+mpris_arg = []  # mpv arguments loading the MPRIS plugin, set once by main
+_open_files = {}  # Likes/dislikes files by path, opened on first use and kept open
+_frame = []   # Lines of the interface as last built by draw_interface
+_shadow = []  # Lines currently on screen; emptied when something else drew over them
+_obuf = io.BytesIO()  # Output for the frame being drawn, written out by flush_frame
+_STDOUT_FD = sys.stdout.fileno()
+_probe_cache = {}  # (path, mtime_ns, size) -> get_song_info() result
+_mpv_sock = None  # Connection to mpv's IPC socket, kept open while mpv runs
+_mpv_buf = b""    # Data received from mpv that doesn't form a complete message yet
+_request_ids = count(1)
+_last_bar_state = None  # What the progress row currently shows, see update_progress_display
+_observed = {}  # Latest values of the properties mpv reports changes for
+_resized = False  # Set by resize_handler, handled by the main loop
+_wakeup_fd = None  # Read end of the pipe Python writes to when a signal arrives, so select() returns
 
 # --- Cleanup ---
 def cleanup():
     """Clean up resources on exit."""
     global mpv_process
+    disconnect_mpv()
     if mpv_process and mpv_process.poll() is None:
         mpv_process.terminate()
         try:
@@ -38,9 +93,12 @@ def cleanup():
             mpv_process.kill()
     if MPV_SOCKET.exists():
         MPV_SOCKET.unlink()
+    for f in _open_files.values():
+        f.close()
     # Restore terminal state
     show_cursor()
-    os.system('clear')
+    emit(_WRAP, CLEAR)
+    flush_frame()
     print("Goodbye!")
     # Restore terminal settings
     if old_termios_settings and sys.stdin.isatty():
@@ -50,9 +108,19 @@ def cleanup():
 def signal_handler(sig, frame):
     cleanup()
 
+def resize_handler(sig, frame):
+    """Note that the terminal was resized; the main loop rebuilds and repaints the interface."""
+    global _resized
+    # Only a flag: draw_interface resets dirty/_shadow when it finishes, which would lose a resize made mid-draw
+    _resized = True
+
 # --- External Tools ---
 def run_fzf(input_list, prompt):
     """Run fzf to select an item from a list."""
+    global _shadow
+    _shadow = []  # fzf draws over the interface; repaint from scratch afterwards
+    emit(_WRAP)
+    flush_frame()
     try:
         fzf_proc = subprocess.run(
             ['fzf', '--prompt', prompt, '--height=40%', '--no-sort'],
@@ -94,14 +162,17 @@ def select_folder():
 
 def get_songs():
     """Get all supported songs from the current folder."""
-    global songs
+    global songs, song_names
     folder_path = MUSIC_ROOT / current_folder
-    found_songs = []
-    for ext in SUPPORTED_EXTENSIONS:
-        found_songs.extend(folder_path.glob(f"*{ext}"))
-        found_songs.extend(folder_path.glob(f"*{ext.upper()}"))
+    exts = {ext.lower() for ext in SUPPORTED_EXTENSIONS}
+    with os.scandir(folder_path) as entries:
+        found_songs = [
+            Path(entry.path) for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in exts and entry.is_file()
+        ]
 
-    songs = sorted(list(set(found_songs))) # Use set to remove duplicates
+    songs = sorted(found_songs, key=lambda p: p.name)
+    song_names = [p.name for p in songs]
 
     if not songs:
         print(f"No songs found in folder '{current_folder}'")
@@ -110,7 +181,6 @@ def get_songs():
 def choose_song():
     """Interactively choose a song from the current list."""
     global current_song_index
-    song_names = [s.name for s in songs]
     selected_song_name = run_fzf(song_names, "🎵 Select Song: ")
     if selected_song_name:
         try:
@@ -121,10 +191,23 @@ def choose_song():
     return False
 
 # --- MPV Player Control ---
+def resolve_mpris():
+    """Find the MPRIS plugin and return the mpv arguments that load it."""
+    mpris_candidates = [
+        Path.home() / ".config/mpv/scripts/mpris.so",
+        Path("/usr/share/mpv/scripts/mpris.so"),
+        Path("/usr/local/share/mpv/scripts/mpris.so")
+    ]
+    for p in mpris_candidates:
+        if p.is_file():
+            return ["--script", str(p)]
+    return []
+
 def play_song():
     """Start playing the current song with mpv."""
-    global mpv_process, needs_full_redraw
+    global mpv_process, dirty
 
+    disconnect_mpv()
     if mpv_process and mpv_process.poll() is None:
         mpv_process.terminate()
         try:
@@ -137,18 +220,6 @@ def play_song():
 
     song_path = songs[current_song_index]
 
-    # Find MPRIS plugin
-    mpris_arg = []
-    mpris_candidates = [
-        Path.home() / ".config/mpv/scripts/mpris.so",
-        Path("/usr/share/mpv/scripts/mpris.so"),
-        Path("/usr/local/share/mpv/scripts/mpris.so")
-    ]
-    for p in mpris_candidates:
-        if p.is_file():
-            mpris_arg = ["--script", str(p)]
-            break
-
     command = [
         'mpv',
         '--no-video',
@@ -166,44 +237,125 @@ def play_song():
         stderr=subprocess.DEVNULL,
     )
 
-    time.sleep(1) # Wait for mpv to start and create the socket
-    needs_full_redraw = True
+    _observed.clear()
+    connect_mpv()
+    dirty |= DIRTY_HEADER | DIRTY_INFO
+
+def ensure_mpv_connected():
+    """Reconnect to mpv, without waiting, if the connection is down while mpv is still running."""
+    if _mpv_sock is None and mpv_process and mpv_process.poll() is None:
+        connect_mpv(timeout=0)
+
+def connect_mpv(timeout=2.0):
+    """Connect to the mpv IPC socket, waiting up to timeout seconds for mpv to create it."""
+    global _mpv_sock
+    disconnect_mpv()
+    deadline = time.monotonic() + timeout
+    while True:
+        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            s.connect(str(MPV_SOCKET))
+            break
+        except OSError:
+            s.close()
+        if time.monotonic() >= deadline or (mpv_process and mpv_process.poll() is not None):
+            return
+        time.sleep(0.02)
+    s.setblocking(False)
+    _mpv_sock = s
+    # Have mpv push position updates (and the duration, once known) instead of asking for them
+    send_mpv_commands(
+        {"command": ["observe_property", 1, "time-pos"]},
+        {"command": ["observe_property", 2, "percent-pos"]},
+        {"command": ["observe_property", 3, "duration"]},
+    )
+
+def disconnect_mpv():
+    """Close the connection to the mpv IPC socket, if open."""
+    global _mpv_sock, _mpv_buf
+    if _mpv_sock:
+        _mpv_sock.close()
+    _mpv_sock = None
+    _mpv_buf = b""
 
-def send_mpv_command(command):
-    """Send a command to the mpv IPC socket."""
-    if not MPV_SOCKET.exists():
-        return None
+def read_mpv_messages(timeout):
+    """Wait up to timeout seconds for data from mpv and return the replies received.
+
+    Property-change events are recorded in _observed rather than returned.
+    """
+    global _mpv_buf
     try:
-        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
-            s.settimeout(0.5)
-            s.connect(str(MPV_SOCKET))
-            s.sendall(json.dumps(command).encode('utf-8') + b'\n')
-            response_data = s.recv(4096)
-            if response_data:
-                return json.loads(response_data)
-            return None
-    except (ConnectionRefusedError, FileNotFoundError, BrokenPipeError, socket.timeout):
-        return None
+        if not select.select([_mpv_sock], [], [], timeout)[0]:
+            return []
+        data = _mpv_sock.recv(4096)
+    except OSError:
+        data = b""
+    if not data: # mpv went away
+        disconnect_mpv()
+        return []
+
+    *lines, _mpv_buf = (_mpv_buf + data).split(b'\n')
+    messages = []
+    for line in lines:
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if message.get("event") == "property-change":
+            _observed[message.get("name")] = message.get("data")
+        elif "event" not in message:
+            messages.append(message)
+    return messages
+
+def send_mpv_commands(*commands):
+    """Send commands to mpv in a single write and wait for their replies, returned in order."""
+    if _mpv_sock is None:
+        return [None] * len(commands)
+    request_ids = [next(_request_ids) for _ in commands]
+    payload = b"".join(
+        json.dumps({**command, "request_id": request_id}).encode('utf-8') + b'\n'
+        for command, request_id in zip(commands, request_ids)
+    )
+    try:
+        _mpv_sock.sendall(payload)
+    except OSError:
+        disconnect_mpv()
+        return [None] * len(commands)
+
+    replies = {}
+    deadline = time.monotonic() + 0.5
+    while _mpv_sock and len(replies) < len(request_ids) and time.monotonic() < deadline:
+        for message in read_mpv_messages(max(0, deadline - time.monotonic())):
+            if message.get("request_id") in request_ids:
+                replies[message["request_id"]] = message
+    return [replies.get(request_id) for request_id in request_ids]
+
+def send_mpv_command(command):
+    """Send a command to mpv and wait for its reply."""
+    return send_mpv_commands(command)[0]
 
 def get_mpv_property(prop):
     """Get a property from mpv."""
     response = send_mpv_command({"command": ["get_property", prop]})
-    if response and response.get("error") == "success":
-        return response.get("data")
-    return None
+    return response.get("data") if response and response.get("error") == "success" else None
 
 # --- Information Gathering ---
 def get_song_info():
     """Get technical info for the current song using ffprobe."""
     song_path = songs[current_song_index]
-    if not song_path.is_file():
+    try:
+        st = song_path.stat()
+    except OSError:
         return "- MB", "- kHz", "- kbps", "-"
 
-    try:
-        # Get size
-        size_bytes = song_path.stat().st_size
-        size_mb = f"{size_bytes / (1024*1024):.2f} MB"
+    key = (str(song_path), st.st_mtime_ns, st.st_size)
+    if key in _probe_cache:
+        return _probe_cache[key]
+
+    # Get size
+    size_mb = f"{st.st_size / (1024*1024):.2f} MB"
 
+    try:
         # Get stream info
         probe_cmd = [
             'ffprobe', '-v', 'error', '-select_streams', 'a:0',
@@ -222,13 +374,34 @@ def get_song_info():
         bit_rate_str = f"{int(bit_rate)//1000} kbps" if bit_rate.isdigit() else "-"
         bit_depth_str = f"{bit_depth}-bit" if str(bit_depth).isdigit() and int(bit_depth) > 0 else "-"
 
-        return size_mb, sample_rate_str, bit_rate_str, bit_depth_str
+        info = size_mb, sample_rate_str, bit_rate_str, bit_depth_str
 
     except (subprocess.CalledProcessError, json.JSONDecodeError, IndexError, KeyError):
-        return f"{song_path.stat().st_size / (1024*1024):.2f} MB", "- kHz", "- kbps", "-"
+        info = size_mb, "- kHz", "- kbps", "-"
+
+    _probe_cache[key] = info
+    return info
 
 
 # --- UI Drawing ---
+@lru_cache(maxsize=None)
+def _goto(row):
+    """Escape sequence moving the cursor to the start of a (1-based) row."""
+    return f"\033[{row};1H".encode()
+
+def emit(*parts):
+    """Queue bytes for the current frame."""
+    _obuf.writelines(parts)
+
+def flush_frame():
+    """Write the queued frame straight to the terminal in one go."""
+    sys.stdout.flush() # Keep any pending text output ahead of the frame
+    data = _obuf.getvalue()
+    _obuf.seek(0)
+    _obuf.truncate()
+    while data:
+        data = data[os.write(_STDOUT_FD, data):]
+
 def format_time_str(seconds):
     """Format seconds to MM:SS."""
     if seconds is None:
@@ -242,76 +415,112 @@ def format_time_str(seconds):
 
 def draw_progress_bar(percent):
     """Draw a Unicode progress bar."""
-    percent = int(float(percent or 0))
-    width = 50
-
-    filled_len = int(width * percent / 100)
-    bar = "█" * filled_len
-    empty_len = width - filled_len
-    bar += "░" * empty_len
-    
-    return f"[\033[1;36m{bar}\033[0m] {percent}%"
+    return _BARS[max(0, min(100, int(float(percent or 0))))]
 
 
 def update_progress_display(percent, current_pos, total_duration):
-    """Update only the progress bar at the bottom of the screen."""
-    total_lines = 5 + len(songs) + 5
-    
-    sys.stdout.write(f"\033[s\033[{total_lines};1H")
+    """Update only the progress bar below the interface, if what it shows has changed."""
+    global _last_bar_state
+    loaded = percent is not None and float(percent or 0) > 0
+    state = (loaded, int(float(percent or 0)), int(float(current_pos or 0)), int(float(total_duration or 0)))
+    if state == _last_bar_state:
+        return
+    _last_bar_state = state
+
+    progress_row = len(_frame) + 1
     
-    if percent is not None and float(percent or 0) > 0:
+    if loaded:
         progress_bar = draw_progress_bar(percent)
         current_formatted = format_time_str(current_pos)
         total_formatted = format_time_str(total_duration)
         
-        line = f"{progress_bar} \033[1;37m{current_formatted} / {total_formatted}\033[0m"
+        line = progress_bar + f" \033[1;37m{current_formatted} / {total_formatted}\033[0m".encode()
     else:
-        line = "\033[1;33mLoading...\033[0m"
+        line = LOADING
         
-    sys.stdout.write("\033[K" + line)
-    sys.stdout.write("\033[u")
-    sys.stdout.flush()
+    emit(_SAVE, _goto(progress_row), _EOL, line, _RESTORE)
+    flush_frame()
+
+def song_line(i):
+    """Format the song list line for songs[i]."""
+    if i == current_song_index:
+        return f" \033[1;32m▶ {song_names[i]}\033[0m".encode()
+    return f"  {song_names[i]}".encode()
+
+def draw_interface():
+    """Draw the TUI, rebuilding only the dirty parts and rewriting only the lines that changed on screen."""
+    global _frame, _shadow, dirty, prev_song_index, list_start, list_rows, _last_bar_state
+
+    if dirty & DIRTY_LIST:
+        list_rows = max(1, shutil.get_terminal_size().lines - CHROME_ROWS)
+        head = [
+            HEADER_BORDER,
+            b"",  # Now playing, filled in below
+            SEPARATOR,
+            b"",  # Song info, filled in below
+            SEPARATOR,
+        ]
+        dirty |= DIRTY_HEADER | DIRTY_INFO
+    else:
+        head = _frame[:LIST_TOP]
 
-def draw_full_interface():
-    """Draw the complete TUI."""
-    size, sample_rate, bit_rate, bit_depth = get_song_info()
-    
-    os.system('clear')
-    print("\033[1;35m╔═══════════════════ NOW PLAYING ═══════════════════╗\033[0m")
-    print(f"\033[1;36m  {current_folder}/\033[1;33m{songs[current_song_index].name}\033[0m")
-    print("\033[1;35m╠═══════════════════════════════════════════════════╣\033[0m")
-    print(f"  \033[1;34mSize:\033[0m {size:<10} \033[1;34mSample Rate:\033[0m {sample_rate:<10} \033[1;34mBitrate:\033[0m {bit_rate:<10} \033[1;34mBit Depth:\033[0m {bit_depth}")
-    print("\033[1;35m╠═══════════════════════════════════════════════════╣\033[0m")
-    
-    for i, song in enumerate(songs):
-        if i == current_song_index:
-            print(f" \033[1;32m▶ {song.name}\033[0m")
-        else:
-            print(f"  {song.name}")
-            
-    print("\033[1;35m╠═══════════════════════ CONTROLS ══════════════════════╣\033[0m")
-    print("  [\033[1;33ml\033[0m] like    [\033[1;31md\033[0m] dislike    [\033[1mn\033[0m] next")
-    print("  [\033[1mb\033[0m] skip −5s    [\033[1mf\033[0m] skip +5s    [\033[1mp/SPACE\033[0m] play/pause")
-    print("  [\033[1ms\033[0m] choose song    [\033[1mc\033[0m] change folder    [\033[1mq\033[0m] quit")
-    print("\033[1;35m╚═══════════════════════════════════════════════════╝\033[0m")
-    print() # Empty line for progress bar
-    sys.stdout.flush()
+    if dirty & DIRTY_LIST or not list_start <= current_song_index < list_start + list_rows:
+        # Only show the songs that fit, scrolled so the current one is in the middle
+        list_start = max(0, min(current_song_index - list_rows // 2, len(songs) - list_rows))
+        list_end = min(len(songs), list_start + list_rows)
+        frame = head + [song_line(i) for i in range(list_start, list_end)] + list(CONTROLS_BLOCK)
+    else:
+        frame = head + _frame[LIST_TOP:]
+        if prev_song_index != current_song_index:
+            # Only the ▶ marker moved
+            frame[LIST_TOP + prev_song_index - list_start] = song_line(prev_song_index)
+            frame[LIST_TOP + current_song_index - list_start] = song_line(current_song_index)
+
+    if dirty & DIRTY_HEADER:
+        frame[1] = f"\033[1;36m  {current_folder}/\033[1;33m{song_names[current_song_index]}\033[0m".encode()
+    if dirty & DIRTY_INFO:
+        size, sample_rate, bit_rate, bit_depth = get_song_info()
+        frame[3] = f"  \033[1;34mSize:\033[0m {size:<10} \033[1;34mSample Rate:\033[0m {sample_rate:<10} \033[1;34mBitrate:\033[0m {bit_rate:<10} \033[1;34mBit Depth:\033[0m {bit_depth}".encode()
+
+    if not _shadow:
+        emit(_NOWRAP, CLEAR)
+    for i, (old, new) in enumerate(zip_longest(_shadow, frame, fillvalue=None)):
+        if new is not None and old != new:
+            emit(_goto(i + 1), _EOL, new)
+    if len(frame) != len(_shadow):
+        # Wipe leftover rows, including the old progress and feedback lines
+        emit(_goto(len(frame) + 1), b"\033[J")
+        _last_bar_state = None
+    emit(_goto(len(frame) + 1))
+    flush_frame()
+
+    # Frames are never modified in place, so both can share the list
+    _frame = _shadow = frame
+    prev_song_index = current_song_index
+    dirty = 0
 
 def show_feedback(message, color_code, duration=1):
     """Show a temporary feedback message."""
-    total_lines = 5 + len(songs) + 4
-    sys.stdout.write(f"\033[s\033[{total_lines};1H\033[K\033[{color_code}m{message}\033[0m\033[u")
-    sys.stdout.flush()
+    feedback_row = len(_frame) + 2
+    emit(_SAVE, _goto(feedback_row), _EOL, f"\033[{color_code}m{message}\033[0m".encode(), _RESTORE)
+    flush_frame()
     time.sleep(duration)
-    sys.stdout.write(f"\033[s\033[{total_lines};1H\033[K\033[u")
-    sys.stdout.flush()
+    emit(_SAVE, _goto(feedback_row), _EOL, _RESTORE)
+    flush_frame()
+
+def append_line(path, line):
+    """Append a line to a file, opening it on first use and keeping it open (line buffered) after."""
+    f = _open_files.get(path)
+    if f is None:
+        f = _open_files[path] = open(path, "a", buffering=1)
+    f.write(line)
 
 # --- Input Handling ---
-def get_key():
-    """Get a single key press without blocking."""
-    if select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], []):
-        return sys.stdin.read(1)
-    return None
+def get_keys():
+    """Get all pending key presses without blocking."""
+    if select.select([sys.stdin], [], [], 0)[0]:
+        return os.read(sys.stdin.fileno(), 64).decode('latin-1')
+    return ""
 
 def hide_cursor():
     sys.stdout.write("\033[?25l")
@@ -323,7 +532,8 @@ def show_cursor():
 
 # --- Main Application Logic ---
 def main():
-    global needs_full_redraw, current_song_index, old_termios_settings
+    global dirty, current_song_index, old_termios_settings, mpris_arg
+    global _resized, _shadow, _wakeup_fd
 
     if not sys.stdin.isatty():
         print("This script requires an interactive terminal.")
@@ -334,7 +544,14 @@ def main():
 
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
-
+    signal.signal(signal.SIGWINCH, resize_handler)
+    # select() is restarted after a signal; a byte in this pipe wakes it up so a resize is repainted right away
+    _wakeup_fd, wakeup_w = os.pipe()
+    os.set_blocking(_wakeup_fd, False)
+    os.set_blocking(wakeup_w, False)
+    signal.set_wakeup_fd(wakeup_w)
+
+    mpris_arg = resolve_mpris()
     select_folder()
     get_songs()
     
@@ -343,38 +560,51 @@ def main():
     
     hide_cursor()
     
-    last_progress_update = 0
-
     try:
         while True:
-            current_time = time.time()
-
-            if needs_full_redraw:
-                draw_full_interface()
-                needs_full_redraw = False
-                last_progress_update = 0
+            if _resized:
+                _resized = False
+                dirty |= DIRTY_ALL
+                _shadow = []
+            if dirty or not _shadow:
+                draw_interface()
 
-            if current_time - last_progress_update >= 1:
-                percent = get_mpv_property("percent-pos")
-                pos = get_mpv_property("time-pos")
-                dur = get_mpv_property("duration")
-                update_progress_display(percent, pos, dur)
-                last_progress_update = current_time
+            ensure_mpv_connected()
+            # mpv reports the position many times a second; this only redraws when the shown values change
+            update_progress_display(_observed.get("percent-pos"), _observed.get("time-pos"), _observed.get("duration"))
 
             if mpv_process and mpv_process.poll() is not None:
                 current_song_index = (current_song_index + 1) % len(songs)
                 play_song()
                 continue
 
-            key = get_key()
-            if key:
+            # Sleep until a key is pressed or mpv sends something
+            mpv_sock = _mpv_sock
+            if mpv_sock:
+                ready, _, _ = select.select([sys.stdin, _wakeup_fd, mpv_sock], [], [], 1)
+            else:
+                # mpv may still be starting up; look for its socket again soon rather than in a second
+                ready, _, _ = select.select([sys.stdin, _wakeup_fd], [], [], 0.1)
+
+            if _wakeup_fd in ready:
+                os.read(_wakeup_fd, 64)  # The handler has already run; just empty the pipe
+
+            if mpv_sock in ready:
+                read_mpv_messages(0) # Picks up property changes
+                if _mpv_sock is None and mpv_process:
+                    # mpv closes the connection when it quits; let it finish so the next pass moves on
+                    try:
+                        mpv_process.wait(timeout=1)
+                    except subprocess.TimeoutExpired:
+                        pass
+
+            keys = get_keys() if sys.stdin in ready else ""
+            for key in keys:
                 if key in ('l', 'L'):
-                    with open(LIKES_FILE, "a") as f:
-                        f.write(f"{current_folder}/{songs[current_song_index].name}\n")
+                    append_line(LIKES_FILE, f"{current_folder}/{song_names[current_song_index]}\n")
                     show_feedback("Liked!", "1;32")
                 elif key in ('d', 'D'):
-                    with open(DISLIKES_FILE, "a") as f:
-                        f.write(f"{current_folder}/{songs[current_song_index].name}\n")
+                    append_line(DISLIKES_FILE, f"{current_folder}/{song_names[current_song_index]}\n")
                     show_feedback("Disliked!", "1;31")
                 elif key in ('n', 'N'):
                     current_song_index = (current_song_index + 1) % len(songs)
@@ -382,13 +612,12 @@ def main():
                 elif key in ('s', 'S'):
                     if choose_song():
                         play_song()
-                    else: # Redraw if fzf was cancelled
-                        needs_full_redraw = True
                 elif key in ('c', 'C'):
                     select_folder()
                     get_songs()
                     current_song_index = 0
                     play_song()
+                    dirty = DIRTY_ALL
                 elif key in ('q', 'Q'):
                     cleanup()
                 elif key in ('p', 'P', ' '):
@@ -397,17 +626,12 @@ def main():
                     send_mpv_command({"command": ["seek", -5, "relative"]})
                 elif key in ('f', 'F'):
                     send_mpv_command({"command": ["seek", 5, "relative"]})
-                
-                if key not in ('p', 'P', ' ', 'b', 'B', 'f', 'F', 'l', 'L', 'd', 'D'):
-                     needs_full_redraw = True
-
-            time.sleep(0.1)
     finally:
         cleanup()
 
 if __name__ == "__main__":
     for cmd in ['mpv', 'fzf', 'ffprobe']:
-        if subprocess.run(['which', cmd], capture_output=True).returncode != 0:
+        if shutil.which(cmd) is None:
             print(f"Error: Required command '{cmd}' not found in PATH.")
             sys.exit(1)
             
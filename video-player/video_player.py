@@ -7,19 +7,170 @@ Opens videos in VLC from an attractive terminal interface
 import os
 import sys
 import subprocess
+import signal
 import glob
 import shutil
 from pathlib import Path
 import json
-import time
 import argparse
+import functools
+import concurrent.futures
+import operator
+import re
+import fnmatch
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class VideoEntry:
+    """A video file found during a scan"""
+    path: str
+    name: str
+    size: int
+    ext: str
+    name_key: str  # lowercased name, the sort key
+    
+    @functools.cached_property
+    def size_str(self):
+        """Human readable file size, only worked out for videos that are actually shown"""
+        size_bytes = self.size
+        if size_bytes is None:
+            return "Unknown"
+        elif size_bytes > 1024**3:  # GB
+            return f"{size_bytes / (1024**3):.1f} GB"
+        elif size_bytes > 1024**2:  # MB
+            return f"{size_bytes / (1024**2):.1f} MB"
+        else:  # KB
+            return f"{size_bytes / 1024:.1f} KB"
+
+# Case-insensitive by filename, full path as tie-breaker
+_video_sort_key = operator.attrgetter('name_key', 'path')
+
+@functools.lru_cache(maxsize=4096)
+def _format_video_info(video_path, cur_prefix):
+    """Format video information; cached since menus re-format the same videos over and over
+
+    cur_prefix is the current directory with a trailing separator.
+    """
+    # Scanned videos live under the current directory, so the relative path is just a slice
+    if video_path.startswith(cur_prefix):
+        rel_path = video_path[len(cur_prefix):]
+    else:
+        rel_path = os.path.relpath(video_path, cur_prefix)
+    filename = os.path.basename(video_path)
+    
+    # The size string is left to VideoEntry.size_str
+    return {
+        'filename': filename,
+        'path': rel_path,
+        'ext': '.' + filename.rpartition('.')[2].upper(),
+        'full_path': video_path
+    }
+
+# Directory listings in flight at once during a scan
+_SCAN_WORKERS = 8
+
+@functools.cache
+def _fzf_path():
+    """Locate fzf on PATH once per process"""
+    return shutil.which('fzf')
+
+def _scan_dir(directory, skip_hidden, exts, recursive, cache=None, predicate=None):
+    """List one directory, returning (VideoEntry objects for its videos, subdirectory paths to descend into)"""
+    try:
+        # Reuse the listing while the directory's mtime is unchanged; only names are cached, so sizes stay fresh
+        if cache is not None:
+            mtime_ns = os.stat(directory).st_mtime_ns
+            cached = cache.get(directory)
+            if cached is not None and cached[0] == mtime_ns:
+                files, subdirs = cached[1], cached[2]
+                return _stat_videos(files, predicate), subdirs
+        entries = os.scandir(directory)
+    except OSError:
+        return [], ()
+    files, subdirs = [], []
+    with entries:
+        for entry in entries:
+            # Skip hidden files and directories if not showing hidden files
+            if skip_hidden and entry.name.startswith('.'):
+                continue
+            # File types come from the directory listing itself, no extra stat needed
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    subdirs.append(entry.path)
+            elif entry.name.lower().endswith(exts) and entry.is_file():
+                files.append((entry.path, entry.name))
+    # Tuples, so callers can't change what the cache hands out next time
+    files, subdirs = tuple(files), tuple(subdirs)
+    if cache is not None:
+        cache[directory] = (mtime_ns, files, subdirs)
+    return _stat_videos(files, predicate), subdirs
+
+def _stat_videos(files, predicate):
+    """Build VideoEntry objects for (path, name) pairs whose name passes predicate"""
+    videos = []
+    for path, name in files:
+        if predicate is not None and not predicate(name):
+            continue
+        try:
+            size_bytes = os.stat(path).st_size
+        except OSError:
+            size_bytes = None
+        # Extension is taken once here instead of re-parsing the name later
+        ext = '.' + name.rpartition('.')[2].upper()
+        videos.append(VideoEntry(path, name, size_bytes, ext, name.lower()))
+    return videos
+
+def _iter_videos(root, skip_hidden, exts, recursive=True, cache=None, predicate=None):
+    """Yield a VideoEntry for every file under root whose name ends with one of exts and passes predicate"""
+    scan_args = (skip_hidden, exts, recursive, cache, predicate)
+    videos, subdirs = _scan_dir(root, *scan_args)
+    yield from videos
+    # Single-subdirectory chains have nothing to list in parallel; threads start at the first branching directory
+    while len(subdirs) == 1:
+        videos, subdirs = _scan_dir(subdirs[0], *scan_args)
+        yield from videos
+    if not subdirs:
+        return
+    
+    # Directories are listed and their files stat'ed on the pool, so the I/O waits overlap
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+        pending = {pool.submit(_scan_dir, d, *scan_args) for d in subdirs}
+        try:
+            while pending:
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    videos, subdirs = future.result()
+                    pending.update(pool.submit(_scan_dir, d, *scan_args) for d in subdirs)
+                    yield from videos
+        finally:
+            # On Ctrl-C, don't wait for the queued listings before leaving the pool
+            pool.shutdown(cancel_futures=True)
 
 class TerminalVideoPlayer:
-    def __init__(self, start_directory=None, auto_play=None, player_cmd=None, recursive=True, show_hidden=False):
+    # Separator lines, built once
+    _SEP70 = "═" * 70 + "\n"
+    _SEP80 = "═" * 80 + "\n"
+    _RULE40 = "─" * 40 + "\n"
+    _RULE70 = "─" * 70 + "\n"
+    _RULE80 = "─" * 80 + "\n"
+    
+    # Uncolored row templates for --list output
+    _CLI_ROW_FMT = "{i:3d}. {name} [{ext}] [{size}]\n"
+    _CLI_PATH_FMT = "     📁 {path}\n"
+    
+    PLAYER_COMMANDS = ('vlc', '/usr/bin/vlc', '/snap/bin/vlc', '/Applications/VLC.app/Contents/MacOS/VLC', 'mpv', 'mplayer')
+    
+    def __init__(self, start_directory=None, auto_play=None, player_cmd=None, recursive=True, show_hidden=False, no_color=False):
         self.current_dir = os.path.abspath(start_directory) if start_directory else os.getcwd()
-        self.video_extensions = ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.mp3', '.wav', '.flac']
+        self._cur_prefix = self.current_dir.rstrip(os.sep) + os.sep
+        self.video_extensions = ('.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.mp3', '.wav', '.flac')
+        self._ext_tuple = tuple(ext.lower() for ext in self.video_extensions)
         self.auto_play = auto_play
         self.custom_player = player_cmd
+        self._player = None
+        self._player_pids = []
+        # Directory listings by path: (mtime_ns, (path, name) of files, subdirectories)
+        self._scan_cache = {}
         self.recursive = recursive
         self.show_hidden = show_hidden
         self.colors = {
@@ -36,120 +187,89 @@ class TerminalVideoPlayer:
             'bg_blue': '\033[44m',
             'bg_green': '\033[42m'
         }
+        # Like ls, only color output that goes to a terminal
+        if no_color or not sys.stdout.isatty():
+            self.colors = {key: '' for key in self.colors}
+            # Nothing to wrap text in, so colorize becomes a no-op
+            self.colorize = lambda text, color: text
+        
+        # Colored row templates for the video lists, so rows don't go through colorize()
+        Y, W, M, C, B, E = (self.colors[c] for c in ('yellow', 'white', 'magenta', 'cyan', 'blue', 'end'))
+        self._row_fmt = f"{Y}{{i:2d}}.{E} {W}{{name}}{E} {M}[{{ext}}]{E} {C}[{{size}}]{E}\n"
+        self._row_path_fmt = f"    {B}📁 {{path}}{E}\n"
+        self._list_row_fmt = f"{Y}{{i:3d}}.{E} {W}{{name}}{E} {M}[{{ext}}]{E} {C}[{{size}}]{E}\n"
+        self._list_path_fmt = f"     📁 {B}{{path}}{E}\n"
+        self._fzf_exe = _fzf_path()
         self.use_fzf = self.check_fzf_available()
         
     def check_fzf_available(self):
         """Check if fzf is available on the system"""
-        return shutil.which('fzf') is not None
+        return self._fzf_exe is not None
     
     def colorize(self, text, color):
         """Add color to text"""
         return f"{self.colors.get(color, '')}{text}{self.colors['end']}"
     
+    def write_parts(self, parts):
+        """Write collected output to the terminal in one go"""
+        sys.stdout.write(''.join(parts))
+        sys.stdout.flush()
+    
     def print_header(self):
         """Print an attractive header"""
-        width = 70
-        print("\n" + "═" * width)
-        print(self.colorize("🎬 TERMINAL VIDEO PLAYER 🎬", 'bold') + self.colorize(" v2.0", 'cyan'))
-        print("═" * width)
-        print(self.colorize(f"📁 Directory: {self.current_dir}", 'yellow'))
+        parts = ["\n", self._SEP70]
+        parts.append(self.colorize("🎬 TERMINAL VIDEO PLAYER 🎬", 'bold') + self.colorize(" v2.0", 'cyan') + "\n")
+        parts.append(self._SEP70)
+        parts.append(self.colorize(f"📁 Directory: {self.current_dir}", 'yellow') + "\n")
         if self.use_fzf:
-            print(self.colorize("⚡ FZF Mode: Enabled", 'green'))
+            parts.append(self.colorize("⚡ FZF Mode: Enabled", 'green') + "\n")
         else:
-            print(self.colorize("📋 FZF Mode: Disabled (install fzf for better experience)", 'yellow'))
-        print("═" * width)
+            parts.append(self.colorize("📋 FZF Mode: Disabled (install fzf for better experience)", 'yellow') + "\n")
+        parts.append(self._SEP70)
+        self.write_parts(parts)
     
     def print_footer(self):
         """Print an attractive footer"""
-        width = 70
-        print("═" * width)
-        print(self.colorize("✨ Happy watching! ✨", 'magenta'))
-        print("═" * width)
+        self.write_parts([
+            self._SEP70,
+            self.colorize("✨ Happy watching! ✨", 'magenta') + "\n",
+            self._SEP70,
+        ])
         
     def find_videos(self, directory=None):
-        """Find all video files in the current directory and optionally subdirectories"""
+        """Find all video files in the current directory and optionally subdirectories
+
+        Returns a list of VideoEntry objects.
+        """
+        videos = list(self.find_videos_iter(directory=directory))
+        
+        # Sort videos alphabetically by filename, ignoring case
+        videos.sort(key=_video_sort_key)
+        return videos
+    
+    def find_videos_iter(self, predicate=None, directory=None):
+        """Yield VideoEntry objects as the scan finds them, in no particular order
+
+        If given, predicate is called with each filename and only matching videos are yielded.
+        """
         if directory is None:
             directory = self.current_dir
             
-        videos = []
-        
-        if self.recursive:
-            # Search recursively for video files
-            for root, dirs, files in os.walk(directory):
-                # Skip hidden directories if not showing hidden files
-                if not self.show_hidden:
-                    dirs[:] = [d for d in dirs if not d.startswith('.')]
-                
-                for file in files:
-                    # Skip hidden files if not showing hidden files
-                    if not self.show_hidden and file.startswith('.'):
-                        continue
-                        
-                    file_lower = file.lower()
-                    if any(file_lower.endswith(ext) for ext in self.video_extensions):
-                        full_path = os.path.join(root, file)
-                        videos.append(full_path)
-        else:
-            # Search only in current directory
-            for file in os.listdir(directory):
-                if not self.show_hidden and file.startswith('.'):
-                    continue
-                    
-                file_path = os.path.join(directory, file)
-                if os.path.isfile(file_path):
-                    file_lower = file.lower()
-                    if any(file_lower.endswith(ext) for ext in self.video_extensions):
-                        videos.append(file_path)
-        
-        # Sort videos alphabetically
-        videos.sort()
-        return videos
+        yield from _iter_videos(directory, not self.show_hidden, self._ext_tuple, self.recursive, self._scan_cache, predicate)
     
-    def format_video_info(self, video_path):
-        """Get formatted video information"""
-        filename = os.path.basename(video_path)
-        rel_path = os.path.relpath(video_path, self.current_dir)
-        
-        # Get file size
-        try:
-            size_bytes = os.path.getsize(video_path)
-            if size_bytes > 1024**3:  # GB
-                size = f"{size_bytes / (1024**3):.1f} GB"
-            elif size_bytes > 1024**2:  # MB
-                size = f"{size_bytes / (1024**2):.1f} MB"
-            else:  # KB
-                size = f"{size_bytes / 1024:.1f} KB"
-        except:
-            size = "Unknown"
-        
-        # Get file extension
-        ext = os.path.splitext(filename)[1].upper()
-        
-        return {
-            'filename': filename,
-            'path': rel_path,
-            'size': size,
-            'ext': ext,
-            'full_path': video_path
-        }
+    def format_video_info(self, video):
+        """Get formatted video information for a VideoEntry"""
+        return _format_video_info(video.path, self._cur_prefix)
     
     def fzf_select_video(self, videos):
         """Use fzf to select a video file"""
         if not videos:
             return None
             
-        # Prepare video list for fzf
-        video_items = []
-        for video in videos:
-            info = self.format_video_info(video)
-            # Create a nice display format
-            display_line = f"{info['filename']} [{info['ext']}] [{info['size']}] ({info['path']})"
-            video_items.append(display_line)
-        
         try:
             # Create fzf command with nice preview and options
             fzf_cmd = [
-                'fzf',
+                self._fzf_exe,
                 '--prompt=🎥 Select video: ',
                 '--height=60%',
                 '--reverse',
@@ -172,16 +292,22 @@ class TerminalVideoPlayer:
                 text=True
             )
             
-            # Send video list to fzf
-            input_text = '\n'.join(video_items)
-            stdout, stderr = process.communicate(input=input_text)
+            # Stream the video list to fzf so it can start filtering right away
+            line_to_video = {}
+            try:
+                for video in videos:
+                    info = self.format_video_info(video)
+                    # Create a nice display format
+                    display_line = f"{info['filename']} [{info['ext']}] [{video.size_str}] ({info['path']})"
+                    line_to_video[display_line] = video
+                    process.stdin.write(display_line + '\n')
+            except BrokenPipeError:
+                pass  # fzf exited before reading everything
+            stdout, stderr = process.communicate()
             
-            if process.returncode == 0 and stdout.strip():
-                # Find the selected video by matching the display line
-                selected_line = stdout.strip()
-                for i, item in enumerate(video_items):
-                    if item == selected_line:
-                        return videos[i]
+            if process.returncode == 0:
+                # Find the selected video by its display line
+                return line_to_video.get(stdout.strip())
             
             return None
             
@@ -192,15 +318,17 @@ class TerminalVideoPlayer:
     def display_videos(self, videos):
         """Display the list of videos with enhanced formatting"""
         if not videos:
-            print(self.colorize("\n❌ No video files found in the current directory.", 'red'))
-            print(self.colorize("💡 Tip: This player searches recursively in subdirectories too!", 'cyan'))
+            self.write_parts([
+                self.colorize("\n❌ No video files found in the current directory.", 'red') + "\n",
+                self.colorize("💡 Tip: This player searches recursively in subdirectories too!", 'cyan') + "\n",
+            ])
             return False
         
-        print(f"\n{self.colorize('📊 Found', 'green')} {self.colorize(str(len(videos)), 'bold')} {self.colorize('video file(s)', 'green')}")
-        print("─" * 70)
+        parts = [f"\n{self.colorize('📊 Found', 'green')} {self.colorize(str(len(videos)), 'bold')} {self.colorize('video file(s)', 'green')}\n"]
+        parts.append(self._RULE70)
         
         if self.use_fzf:
-            print(self.colorize("⚡ FZF mode enabled - enhanced selection available!", 'cyan'))
+            parts.append(self.colorize("⚡ FZF mode enabled - enhanced selection available!", 'cyan') + "\n")
         else:
             # Display first 10 videos in list mode
             display_count = min(10, len(videos))
@@ -209,40 +337,37 @@ class TerminalVideoPlayer:
                 info = self.format_video_info(video)
                 
                 # Create a nice display format with colors
-                number = self.colorize(f"{i+1:2d}.", 'yellow')
-                name = self.colorize(info['filename'], 'white')
-                ext = self.colorize(f"[{info['ext']}]", 'magenta')
-                size = self.colorize(f"[{info['size']}]", 'cyan')
-                
-                print(f"{number} {name} {ext} {size}")
+                parts.append(self._row_fmt.format(i=i + 1, name=info['filename'], ext=info['ext'], size=video.size_str))
                 
                 # Truncate if filename too long
                 if len(info['filename']) > 50:
-                    print(f"    {self.colorize('📁 ' + info['path'], 'blue')}")
+                    parts.append(self._row_path_fmt.format(path=info['path']))
             
             if len(videos) > 10:
                 remaining = len(videos) - 10
-                print(self.colorize(f"    ... and {remaining} more files", 'yellow'))
-                print(self.colorize("    💡 Install 'fzf' for better browsing experience!", 'cyan'))
+                parts.append(self.colorize(f"    ... and {remaining} more files", 'yellow') + "\n")
+                parts.append(self.colorize("    💡 Install 'fzf' for better browsing experience!", 'cyan') + "\n")
         
-        print("─" * 70)
+        parts.append(self._RULE70)
+        self.write_parts(parts)
         return True
     
     def show_menu(self, video_count):
         """Display the main menu with attractive formatting"""
-        print(f"\n{self.colorize('🎯 OPTIONS:', 'bold')}")
+        parts = [f"\n{self.colorize('🎯 OPTIONS:', 'bold')}\n"]
         
         if self.use_fzf:
-            print(f"  {self.colorize('f', 'green')} - {self.colorize('Use FZF to select video', 'white')}")
+            parts.append(f"  {self.colorize('f', 'green')} - {self.colorize('Use FZF to select video', 'white')}\n")
         
         if video_count <= 20:  # Show numbered selection for small lists
-            print(f"  {self.colorize('1-' + str(video_count), 'yellow')} - {self.colorize('Select video by number', 'white')}")
+            parts.append(f"  {self.colorize('1-' + str(video_count), 'yellow')} - {self.colorize('Select video by number', 'white')}\n")
         
-        print(f"  {self.colorize('l', 'blue')} - {self.colorize('List all videos', 'white')}")
-        print(f"  {self.colorize('r', 'magenta')} - {self.colorize('Refresh/Rescan directory', 'white')}")
-        print(f"  {self.colorize('d', 'cyan')} - {self.colorize('Change directory', 'white')}")
-        print(f"  {self.colorize('q', 'red')} - {self.colorize('Quit', 'white')}")
-        print("─" * 40)
+        parts.append(f"  {self.colorize('l', 'blue')} - {self.colorize('List all videos', 'white')}\n")
+        parts.append(f"  {self.colorize('r', 'magenta')} - {self.colorize('Refresh/Rescan directory', 'white')}\n")
+        parts.append(f"  {self.colorize('d', 'cyan')} - {self.colorize('Change directory', 'white')}\n")
+        parts.append(f"  {self.colorize('q', 'red')} - {self.colorize('Quit', 'white')}\n")
+        parts.append(self._RULE40)
+        self.write_parts(parts)
     
     def get_user_choice(self, videos):
         """Get user's selection with enhanced interface"""
@@ -296,79 +421,93 @@ class TerminalVideoPlayer:
             
         if os.path.isdir(new_dir):
             self.current_dir = os.path.abspath(new_dir)
+            self._cur_prefix = self.current_dir.rstrip(os.sep) + os.sep
             print(self.colorize(f"✅ Changed to: {self.current_dir}", 'green'))
             return True
         else:
             print(self.colorize(f"❌ Directory not found: {new_dir}", 'red'))
             return False
     
-    def list_all_videos(self, videos):
-        """List all videos with detailed information"""
-        if not videos:
-            print(self.colorize("❌ No videos found.", 'red'))
-            return
-            
-        print(f"\n{self.colorize('📋 ALL VIDEOS', 'bold')} ({len(videos)} files)")
-        print("═" * 80)
-        
+    def format_rows(self, videos, row_fmt, path_fmt, parts):
+        """Append one numbered row per video to parts, using the given row and path templates"""
         for i, video in enumerate(videos, 1):
             info = self.format_video_info(video)
             
             # Format the display line
-            number = self.colorize(f"{i:3d}.", 'yellow')
-            name = self.colorize(info['filename'], 'white')
-            ext = self.colorize(f"[{info['ext']}]", 'magenta')
-            size = self.colorize(f"[{info['size']}]", 'cyan')
-            path = self.colorize(info['path'], 'blue')
-            
-            print(f"{number} {name} {ext} {size}")
+            parts.append(row_fmt.format(i=i, name=info['filename'], ext=info['ext'], size=video.size_str))
             if info['path'] != info['filename']:  # Show path if different from filename
-                print(f"     📁 {path}")
+                parts.append(path_fmt.format(path=info['path']))
+    
+    def list_all_videos(self, videos):
+        """List all videos with detailed information"""
+        if not videos:
+            print(self.colorize("❌ No videos found.", 'red'))
+            return
             
-        print("═" * 80)
+        parts = [f"\n{self.colorize('📋 ALL VIDEOS', 'bold')} ({len(videos)} files)\n"]
+        parts.append(self._SEP80)
+        self.format_rows(videos, self._list_row_fmt, self._list_path_fmt, parts)
+        parts.append(self._SEP80)
+        self.write_parts(parts)
         input(f"\n{self.colorize('Press Enter to continue...', 'yellow')}")
     
-    def play_video(self, video_path):
+    def find_player(self):
+        """Return the full path of the player to use, or None if none is installed
+
+        Looked up once with shutil.which, so launching never forks for a missing player.
+        """
+        if self._player is None:
+            # Use custom player if specified, else try different player commands based on system
+            commands = [self.custom_player] if self.custom_player else self.PLAYER_COMMANDS
+            self._player = next(filter(None, map(shutil.which, commands)), None)
+        return self._player
+    
+    def spawn_player(self, player, video_path):
+        """Start the player in the background with its output discarded
+
+        Uses posix_spawn where available, which skips copying this process's page tables the way fork does.
+        """
+        if not hasattr(os, 'posix_spawn'):
+            subprocess.Popen([player, video_path], 
+                           stdout=subprocess.DEVNULL, 
+                           stderr=subprocess.DEVNULL)
+            return
+        
+        # Reap players that have exited since the last launch so they don't linger as zombies
+        for pid in self._player_pids[:]:
+            if os.waitpid(pid, os.WNOHANG)[0]:
+                self._player_pids.remove(pid)
+        
+        devnull = [(os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_WRONLY, 0) for fd in (1, 2)]
+        # Python ignores SIGPIPE and SIGXFSZ; reset them like Popen does so the player starts with default handlers
+        self._player_pids.append(os.posix_spawn(player, [player, video_path], os.environ, file_actions=devnull,
+                                                setsigdef=(signal.SIGPIPE, signal.SIGXFSZ)))
+    
+    def play_video(self, video):
         """Play video using configured player with enhanced feedback"""
-        info = self.format_video_info(video_path)
+        info = self.format_video_info(video)
         
         print(f"\n{self.colorize('🎥 PLAYING VIDEO', 'bold')}")
         print("─" * 50)
         print(f"📽️  File: {self.colorize(info['filename'], 'cyan')}")
         print(f"📁 Path: {self.colorize(info['path'], 'blue')}")
-        print(f"📊 Size: {self.colorize(info['size'], 'yellow')}")
+        print(f"📊 Size: {self.colorize(video.size_str, 'yellow')}")
         print(f"🎬 Type: {self.colorize(info['ext'], 'magenta')}")
         print("─" * 50)
         
-        # Animation while opening (only in interactive mode)
         if not self.auto_play:
-            print("🚀 Launching player", end="", flush=True)
-            for i in range(3):
-                time.sleep(0.5)
-                print(".", end="", flush=True)
-            print()
+            print("🚀 Launching player...")
         
         try:
-            # Use custom player if specified
-            if self.custom_player:
-                player_commands = [self.custom_player]
-            else:
-                # Try different player commands based on system
-                player_commands = ['vlc', '/usr/bin/vlc', '/snap/bin/vlc', '/Applications/VLC.app/Contents/MacOS/VLC', 'mpv', 'mplayer']
-            
-            for cmd in player_commands:
-                try:
-                    # Run player in the background so terminal remains usable
-                    subprocess.Popen([cmd, video_path], 
-                                   stdout=subprocess.DEVNULL, 
-                                   stderr=subprocess.DEVNULL)
-                    player_name = os.path.basename(cmd).upper()
-                    print(self.colorize(f"✅ {player_name} opened successfully!", 'green'))
-                    if not self.auto_play:
-                        print(self.colorize("💡 You can continue using this player while the video is running.", 'cyan'))
-                    return True
-                except FileNotFoundError:
-                    continue
+            player = self.find_player()
+            if player is not None:
+                # Run player in the background so terminal remains usable
+                self.spawn_player(player, info['full_path'])
+                player_name = os.path.basename(player).upper()
+                print(self.colorize(f"✅ {player_name} opened successfully!", 'green'))
+                if not self.auto_play:
+                    print(self.colorize("💡 You can continue using this player while the video is running.", 'cyan'))
+                return True
             
             print(self.colorize("❌ No video player found. Please install VLC, MPV, or specify a custom player.", 'red'))
             print(self.colorize("💡 Try: sudo apt install vlc (Ubuntu/Debian) or brew install vlc (macOS)", 'yellow'))
@@ -380,8 +519,12 @@ class TerminalVideoPlayer:
     
     def run(self):
         """Main program loop with enhanced interface"""
-        # Clear screen for better presentation
-        os.system('clear' if os.name == 'posix' else 'cls')
+        # Clear screen for better presentation; write the escape ourselves rather than running clear
+        if os.name == 'nt':
+            os.system('cls')
+        elif sys.stdout.isatty():
+            sys.stdout.write("\033[H\033[2J\033[3J")
+            sys.stdout.flush()
         
         self.print_header()
         
@@ -412,6 +555,8 @@ class TerminalVideoPlayer:
                 break
             elif choice == 'refresh':
                 print(self.colorize("🔄 Refreshing video list...", 'yellow'))
+                self._scan_cache.clear()
+                _format_video_info.cache_clear()
                 continue
             elif choice == 'list':
                 self.list_all_videos(videos)
@@ -420,8 +565,7 @@ class TerminalVideoPlayer:
                 self.change_directory()
                 continue
             elif isinstance(choice, tuple) and choice[0] == 'play':
-                video_path = choice[1]
-                success = self.play_video(video_path)
+                success = self.play_video(choice[1])
                 
                 if success:
                     # Ask if user wants to continue
@@ -440,16 +584,11 @@ class TerminalVideoPlayer:
             print(self.colorize("No video files found.", 'red'))
             return
             
-        print(f"\nFound {self.colorize(str(len(videos)), 'green')} video file(s) in {self.colorize(self.current_dir, 'cyan')}")
-        print("─" * 80)
-        
-        for i, video in enumerate(videos, 1):
-            info = self.format_video_info(video)
-            print(f"{i:3d}. {info['filename']} [{info['ext']}] [{info['size']}]")
-            if info['path'] != info['filename']:
-                print(f"     📁 {info['path']}")
-        
-        print("─" * 80)
+        parts = [f"\nFound {self.colorize(str(len(videos)), 'green')} video file(s) in {self.colorize(self.current_dir, 'cyan')}\n"]
+        parts.append(self._RULE80)
+        self.format_rows(videos, self._CLI_ROW_FMT, self._CLI_PATH_FMT, parts)
+        parts.append(self._RULE80)
+        self.write_parts(parts)
     
     def play_video_by_number(self, videos, number):
         """Play video by its number in the list"""
@@ -459,15 +598,15 @@ class TerminalVideoPlayer:
             print(self.colorize(f"❌ Invalid video number. Please choose between 1 and {len(videos)}", 'red'))
             return False
     
-    def play_video_by_name(self, videos, name):
-        """Play video by matching filename (fuzzy matching)"""
-        name_lower = name.lower()
-        matches = []
+    def play_video_by_name(self, name):
+        """Play video by matching filename (fuzzy matching, * and ? work as wildcards)"""
+        if '*' in name or '?' in name:
+            # Wildcards may match anywhere in the filename, like a plain substring
+            predicate = re.compile(fnmatch.translate(f"*{name}*"), re.IGNORECASE).match
+        else:
+            predicate = re.compile(re.escape(name), re.IGNORECASE).search
         
-        for video in videos:
-            filename = os.path.basename(video).lower()
-            if name_lower in filename:
-                matches.append(video)
+        matches = sorted(self.find_videos_iter(predicate), key=_video_sort_key)
         
         if not matches:
             print(self.colorize(f"❌ No video found matching '{name}'", 'red'))
@@ -477,8 +616,7 @@ class TerminalVideoPlayer:
         else:
             print(self.colorize(f"Multiple matches found for '{name}':", 'yellow'))
             for i, match in enumerate(matches, 1):
-                filename = os.path.basename(match)
-                print(f"{i}. {filename}")
+                print(f"{i}. {match.name}")
             print(self.colorize("Please be more specific or use the video number.", 'yellow'))
             return False
 
@@ -577,13 +715,10 @@ def main():
             auto_play=args.auto_play,
             player_cmd=args.player,
             recursive=not args.no_recursive,
-            show_hidden=args.show_hidden
+            show_hidden=args.show_hidden,
+            no_color=args.no_color
         )
         
-        # Disable colors if requested
-        if args.no_color:
-            player.colors = {key: '' for key in player.colors}
-        
         # Handle CLI-specific actions
         if args.list or args.play or args.fzf or args.auto_play:
             # Non-interactive mode
@@ -591,19 +726,18 @@ def main():
                 if not args.auto_play:  # Don't show header in auto-play mode
                     player.print_header()
             
-            videos = player.find_videos()
-            
             if args.list:
-                player.list_videos_cli(videos)
+                player.list_videos_cli(player.find_videos())
                 
             elif args.play:
                 try:
                     # Try to parse as number first
                     video_num = int(args.play)
-                    success = player.play_video_by_number(videos, video_num)
                 except ValueError:
                     # Treat as filename
-                    success = player.play_video_by_name(videos, args.play)
+                    success = player.play_video_by_name(args.play)
+                else:
+                    success = player.play_video_by_number(player.find_videos(), video_num)
                 
                 sys.exit(0 if success else 1)
                 
@@ -612,7 +746,7 @@ def main():
                     print(player.colorize("❌ FZF not available. Please install fzf.", 'red'))
                     sys.exit(1)
                 
-                selected = player.fzf_select_video(videos)
+                selected = player.fzf_select_video(player.find_videos())
                 if selected:
                     success = player.play_video(selected)
                     sys.exit(0 if success else 1)
@@ -622,7 +756,7 @@ def main():
                     
             elif args.auto_play:
                 # Find video by name and play it
-                success = player.play_video_by_name(videos, args.auto_play)
+                success = player.play_video_by_name(args.auto_play)
                 sys.exit(0 if success else 1)
         else:
             # Interactive mode (default)